@@ -14,6 +14,12 @@ class FrontendData:
         self.to_speak = to_speak
         self.is_mic_on = is_mic_on
 
+        # Set before the handlers are registered so early packets never see missing state
+        self.current_gaze = (0, 0, 0, 0)
+
+        # monotonic() has no defined origin, so start infinitely far in the past
+        self.last_blink = float('-inf')
+
         # Tell the api that we wish to receive eye tracking data stream
         # with self._handle_et_data as the handler
         self._api.register_stream_handler(adhawkapi.PacketType.EYETRACKING_STREAM, self._handle_et_data)
@@ -24,10 +30,6 @@ class FrontendData:
         # When the api detects a connection to a MindLink, this function will be run.
         self._api.start(tracker_connect_cb=self._handle_tracker_connect,
                         tracker_disconnect_cb=self._handle_tracker_disconnect)
-        
-        self.current_gaze = (0, 0, 0, 0)
-
-        self.last_blink = 0
 
     def shutdown(self):
         '''Shutdown the api and terminate the bluetooth connection'''
@@ -46,12 +48,12 @@ class FrontendData:
         if event_type == adhawkapi.Events.BLINK:
             duration = args[0]
             
-            if time.time() - self.last_blink < 0.5:
+            if time.monotonic() - self.last_blink < 0.5:
                 print("Double blink")
                 self.is_mic_on.value = not self.is_mic_on.value
                 self.to_speak.value = "Mic on" if self.is_mic_on.value else "Mic off"
             else: 
-                self.last_blink = time.time()
+                self.last_blink = time.monotonic()
 
 
 
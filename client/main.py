@@ -55,6 +55,11 @@ def calculate_h_v_fov(diagonal_fov, aspect_ratio):
     vfov = 2 * np.arctan(h / (2*d))
     return np.degrees(hfov), np.degrees(vfov)
 
+# Scene camera: 82 degree diagonal field of view with a 4:3 sensor
+CAMERA_DIAGONAL_FOV = 82
+CAMERA_ASPECT_RATIO = (4, 3)
+CAMERA_HFOV, CAMERA_VFOV = calculate_h_v_fov(CAMERA_DIAGONAL_FOV, CAMERA_ASPECT_RATIO)
+
 def project_3d_to_2d(point, hfov, vfov):
     x, y, z, _ = point
     x_prime = x / (z * np.tan(np.radians(hfov) / 2))
@@ -112,8 +117,7 @@ def imageProcess(transcription, to_speak, is_mic_on):
                 break
 
             if tracker.current_gaze != [0, 0, 0, 0]:
-                hfov, vfov = calculate_h_v_fov(82, (4, 3))
-                normalized_2d_point = project_3d_to_2d(tracker.current_gaze, hfov, vfov)
+                normalized_2d_point = project_3d_to_2d(tracker.current_gaze, CAMERA_HFOV, CAMERA_VFOV)
                 pixel_point = viewport_transform(normalized_2d_point, frame.shape[1], frame.shape[0])
 
                 centre_point = (550 -pixel_point[0], 175 -pixel_point[1])